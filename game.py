@@ -1,95 +1,138 @@
-import os
+import bisect
+import operator
 import random
+import sys
 import time
 
+SUITS = ("h", "d", "c", "s")
+RANKS = ("2", "3", "4", "5", "6", "7", "8", "9", "10",
+         "J", "Q", "K", "A")
+
+_SUIT_IDX = {"h": 0, "s": 1, "d": 2, "c": 3}
+_RANK_IDX = {rank: i + 1 for i, rank in enumerate(RANKS)}
+
+# Packed lookup tables indexed by card id (cid = suit_idx * 13 +
+# rank_idx): byte i holds the suit index / rank value of card i, so a
+# whole hand of ids fits in a single cache line.
+SUIT = bytes(i // 13 for i in range(52))
+RANK = bytes(i % 13 + 1 for i in range(52))
+
+# One bit per card id; SUIT_MASK[s] selects the 13 cards of suit s, so
+# "any card of suit s in hand" is a single AND against the hand mask.
+SUIT_MASK = tuple(((1 << 13) - 1) << (s * 13) for s in range(4))
+
+# C-level key extraction for hand sorts: the key is computed once per
+# card instead of once per comparison.
+_SORT_KEY = operator.attrgetter("sort_key")
+
+# Display strings interned once per card id instead of an f-string
+# allocation per Card.
+_DISPLAY = tuple(f"{RANKS[i % 13]}{'HSDC'[i // 13]}" for i in range(52))
+
+# ANSI cursor-home + erase-screen; clearing this way is a single write
+# instead of forking a shell with os.system.
+_CLEAR = "\x1b[H\x1b[2J"
+
+
+def _clear():
+    sys.stdout.write(_CLEAR)
+    sys.stdout.flush()
+
 
 class Card:
+    __slots__ = ("suit", "rank", "suit_idx", "rank_value", "cid",
+                 "sort_key", "display")
+
     def __init__(self, suit, rank):
         self.suit = suit
         self.rank = rank
-        self.display = f"{rank}{suit.upper()}"
-        self.dictHand = {
-            "rank": rank,
-            "suit": suit[0].lower(),
-        }
+        self.suit_idx = _SUIT_IDX[suit]
+        self.rank_value = _RANK_IDX[rank]
+        self.cid = self.suit_idx * 13 + self.rank_value - 1
+        self.sort_key = self.suit_idx * 100 - self.rank_value
+        self.display = _DISPLAY[self.cid]
 
     def __repr__(self):
         return self.display
 
 
+# Cards are immutable, so every deck shares this single pool instead of
+# rebuilding 52 Card objects per hand. Built in _SUIT_IDX suit order so
+# the pool is cid-indexed: _FULL_DECK[card.cid] is card.
+_FULL_DECK = tuple(
+    Card(suit, rank)
+    for suit in sorted(SUITS, key=_SUIT_IDX.__getitem__)
+    for rank in RANKS
+)
+
+
 class Deck:
     def __init__(self):
-        suits = ["h", "d", "c", "s"]
-        ranks = ["2", "3", "4", "5", "6", "7", "8", "9", "10",
-                 "J", "Q", "K", "A"]
-
-        self.cards = [Card(suit, rank) for suit in suits for rank in ranks]
+        self.cards = list(_FULL_DECK)
+        self._pos = 0
 
     def shuffle(self):
         random.shuffle(self.cards)
+        self._pos = 0
 
     def deal(self, numCards):
-        dealtCards = self.cards[:numCards]
-        self.cards = self.cards[numCards:]
+        dealtCards = self.cards[self._pos:self._pos + numCards]
+        self._pos += numCards
         return dealtCards
 
 
 class Player:
-    def __init__(self, name):
+    __slots__ = ("name", "team", "hand", "bid", "hand_mask",
+                 "_hand_str_cache")
+
+    def __init__(self, name, team=0):
         self.name = name
+        self.team = team
+        self.reset()
+
+    def reset(self):
         self.hand = []
         self.bid = None
+        self.hand_mask = 0
+        self._hand_str_cache = None
 
     def clearHand(self):
         self.hand = []
+        self.hand_mask = 0
+        self._hand_str_cache = None
 
     def addCard(self, card):
-        self.hand.append(card)
+        bisect.insort(self.hand, card, key=_SORT_KEY)
+        self.hand_mask |= 1 << card.cid
+        self._hand_str_cache = None
+
+    def setHand(self, cards):
+        self.hand = list(cards)
+        self.organizeHand()
+        self.hand_mask = 0
+        for card in self.hand:
+            self.hand_mask |= 1 << card.cid
 
     def playCard(self, cardIndex):
-        return self.hand.pop(cardIndex)
+        card = self.hand.pop(cardIndex)
+        self.hand_mask &= ~(1 << card.cid)
+        self._hand_str_cache = None
+        return card
+
+    def hasSuit(self, suit):
+        return bool(self.hand_mask & SUIT_MASK[_SUIT_IDX[suit]])
 
     def showHand(self):
         return [str(card) for card in self.hand]
 
-    def organizeHand(self):
-        suitOrder = {"h": 0, "s": 1, "d": 2, "c": 3}
-        self.hand = sorted(
-            self.hand,
-            key=lambda card: (
-                suitOrder[card.suit],
-                -self._cardSortKey(card),
-            ),
-        )
-
-    def _cardSortKey(self, card):
-        rankOrder = {
-            "2": 1,
-            "3": 2,
-            "4": 3,
-            "5": 4,
-            "6": 5,
-            "7": 6,
-            "8": 7,
-            "9": 8,
-            "10": 9,
-            "J": 10,
-            "Q": 11,
-            "K": 12,
-            "A": 13,
-        }
-
-        return rankOrder[card.rank]
-
-    def _suitSortKey(self, suit):
-        suitOrder = {
-            "Hearts": 0,
-            "Spades": 1,
-            "Diamonds": 2,
-            "Clubs": 3,
-        }
+    def showHandStr(self):
+        if self._hand_str_cache is None:
+            self._hand_str_cache = ", ".join(self.showHand())
+        return self._hand_str_cache
 
-        return suitOrder[suit]
+    def organizeHand(self):
+        self.hand.sort(key=_SORT_KEY)
+        self._hand_str_cache = None
 
     def setBid(self, bid):
         if bid:
@@ -103,19 +146,22 @@ class TarneebGame:
         self.playerNames = playerNames
         self.scores = [0, 0]
         self.isOver = False
+        self.ui_delay = 2
+        self.players = [
+            Player(name, i % 2) for i, name in enumerate(playerNames)
+        ]
+        self._idx_by_name = {
+            player.name: i for i, player in enumerate(self.players)
+        }
         self._resetValues()
 
     def _getCardValue(self, card):
-        suit = card.suit
-
-        value = self._cardSortKey(card)
+        suitIdx = card.suit_idx
+        rank = card.rank_value
+        isTrump = suitIdx == self._trump_idx
+        isLead = suitIdx == self._lead_idx
 
-        if suit == self.trump:
-            return 2 * value
-        elif suit == self.firstPlayedSuit:
-            return value
-        else:
-            return 0
+        return rank * (1 + isTrump) * (isTrump | isLead)
 
     def cleanHands(self):
         for player in self.players:
@@ -123,20 +169,17 @@ class TarneebGame:
 
     def dealDeck(self):
         self.cleanHands()
-        for _ in range(13):
-            for player in self.players:
-                if not self.deck.cards:
-                    self.deck = Deck()
-                    self.deck.shuffle()
 
-                player.addCard(self.deck.deal(1)[0])
-
-        for player in self.players:
-            player.organizeHand()
+        # Every deal is a fresh shuffle; the no-bid re-deal loop in
+        # playRound relies on this to produce new hands.
+        self.deck.shuffle()
+        cards = self.deck.cards
+        for i, player in enumerate(self.players):
+            player.setHand(cards[i * 13:(i + 1) * 13])
 
     def displayHands(self):
         for player in self.players:
-            print(f"{player.name}'s hand: {', '.join(player.showHand())}\n")
+            print(f"{player.name}'s hand: {player.showHandStr()}\n")
 
     def getBid(self, player):
         highestBid = self.highestBid["bid"] or 7
@@ -179,11 +222,10 @@ class TarneebGame:
                 print(f"{player.name} bids {bid}")
 
         if not self.highestBid["bid"]:
-            os.system("clear")
+            _clear()
             print("No one bid; restarting round.\n")
 
-            self.dealDeck()
-            self.playRound()
+            return False
 
         print(f"\n{self.highestBid['player']} won the bid.\n")
         self.trump = input("Enter trump suit (h, s, d, c): ")
@@ -197,30 +239,35 @@ class TarneebGame:
             self.trump = input("Enter trump suit (h, s, d, c): ")
             print()
 
+        trumpIdx = _SUIT_IDX[self.trump]
+        self._trump_idx = trumpIdx
+        self._trump_vals = [
+            2 * RANK[cid] if SUIT[cid] == trumpIdx else 0 for cid in range(52)
+        ]
+
+        return True
+
     def playRound(self):
         print(f"Round {self.round} started.\n")
         self.displayHands()
 
         if self.round == 1:
-            self.getBids()
+            # Re-deal iteratively until someone bids; recursing back into
+            # playRound here would grow the stack on repeated pass-outs.
+            while not self.getBids():
+                self.dealDeck()
+                self.displayHands()
 
             # Determine the order of players based on the bid winner
-            startIndex = self.players.index(
-                next(
-                    player
-                    for player in self.players
-                    if player.name == self.highestBid["player"]
-                )
-            )
+            startIndex = self._idx_by_name[self.highestBid["player"]]
         else:
             startIndex = 0
             if self.prevWinner:
-                winner = self.prevWinner
-                startIndex = self.players.index(winner)
+                startIndex = self._idx_by_name[self.prevWinner.name]
 
-        self.players = self.players[startIndex:] + self.players[:startIndex]
+        self._turn_start = startIndex
 
-        os.system("clear")
+        _clear()
 
         curScoresSplit = ' - '.join(map(str, self.curScores))
         totalScoresSplit = ' - '.join(map(str, self.scores))
@@ -236,7 +283,6 @@ class TarneebGame:
 
     def getCardsFromPlayer(self, i, player):
         cardIndex = None
-        allSuitsInPlayersHand = set([card.suit for card in player.hand])
 
         while True:
             string = (
@@ -251,9 +297,10 @@ class TarneebGame:
                 self._getCardValue(card)
                 if i == 0:
                     self.firstPlayedSuit = card.suit
+                    self._lead_idx = card.suit_idx
                     break
 
-                if self.firstPlayedSuit in allSuitsInPlayersHand:
+                if player.hasSuit(self.firstPlayedSuit):
                     if card.suit == self.firstPlayedSuit:
                         break
                     else:
@@ -269,9 +316,10 @@ class TarneebGame:
         return cardIndex, card
 
     def getCards(self):
-        for i, player in enumerate(self.players):
+        for i in range(len(self.players)):
+            player = self.players[(self._turn_start + i) & 3]
             name = player.name
-            print(f"{name}'s hand: {', '.join(player.showHand())}")
+            print(f"{name}'s hand: {player.showHandStr()}")
 
             cardIndex, card = self.getCardsFromPlayer(i, player)
 
@@ -287,22 +335,18 @@ class TarneebGame:
 
         self.playedCards = []
 
-    def _cardSortKey(self, card):
-        rankOrder = {
-            "2": 1, "3": 2, "4": 3, "5": 4, "6": 5,
-            "7": 6, "8": 7, "9": 8, "10": 9,
-            "J": 10, "Q": 11, "K": 12, "A": 13,
-        }
-
-        return rankOrder[card.rank]
-
     def determineWinner(self):
+        firstIdx = _SUIT_IDX[self.firstPlayedSuit]
+        trumpVals = self._trump_vals
+
         cardValues = [
-            int(self._getCardValue(card["card"])) for card in self.playedCards
+            trumpVals[cid] or (RANK[cid] if SUIT[cid] == firstIdx else 0)
+            for cid in (card["card"].cid for card in self.playedCards)
         ]
 
-        winningCard = max(cardValues)
-        winningCardIndex = cardValues.index(winningCard)
+        winningCardIndex, winningCard = max(
+            enumerate(cardValues), key=operator.itemgetter(1)
+        )
         winningCardDisplay = self.playedCards[winningCardIndex]["card"]
         winningPlayer = self.playedCards[winningCardIndex]["player"]
 
@@ -311,10 +355,7 @@ class TarneebGame:
             f"the round with {winningCardDisplay}!"
         )
 
-        if winningPlayer.name in ["Player 1", "Player 3"]:
-            self.curScores[0] += 1
-        else:
-            self.curScores[1] += 1
+        self.curScores[winningPlayer.team] += 1
 
         self.playedCards = []
 
@@ -329,14 +370,13 @@ class TarneebGame:
                 self.round += 1
                 self.playRound()
 
-                time.sleep(2)
-                os.system("clear")
+                if self.ui_delay:
+                    time.sleep(self.ui_delay)
+                _clear()
 
-            n = 0
-            N = 1
-            if self.highestBid["player"] not in ["Player 1", "Player 3"]:
-                n = 1
-                N = 0
+            bidder = self.players[self._idx_by_name[self.highestBid["player"]]]
+            n = bidder.team
+            N = 1 - n
 
             if self.curScores[n] >= self.highestBid["bid"]:
                 self.scores[n] += self.curScores[n]
@@ -349,18 +389,22 @@ class TarneebGame:
 
     def _resetValues(self):
         self.deck = Deck()
-        self.deck.shuffle()
 
         self.round = 0
         self.firstPlayedSuit = None
         self.trump = None
+        self._trump_idx = -1
+        self._lead_idx = -1
+        self._trump_vals = None
         self.prevWinner = None
 
         self.curScores = [0, 0]
         self.playedCards = []
+        self._turn_start = 0
 
         self.highestBid = {"bid": None, "player": ""}
-        self.players = [Player(name) for name in self.playerNames]
+        for player in self.players:
+            player.reset()
 
     def printWinners(self):
         if self.scores[0] > self.scores[1]:
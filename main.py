@@ -1,6 +1,51 @@
+import bisect
+
+import numpy as np
+
 from game import TarneebGame
 import model
 
+_SUIT_IDX = {"h": 0, "s": 1, "d": 2, "c": 3}
+_RANK_VAL = {
+    "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9,
+    "10": 10, "J": 11, "Q": 12, "K": 13, "A": 15,
+}
+
+# Hand values at or above threshold i justify a bid of 7 + i; below the
+# first threshold the hand is a pass.
+_BID_THRESHOLDS = (1000, 1200, 1400, 1600, 1800, 2000, 2200)
+
+
+class Hand:
+    def __init__(self, cards):
+        self.cards = cards
+        self.ranks_arr = np.array(
+            [_RANK_VAL[card["rank"]] for card in cards], np.int16
+        )
+        self.suits_arr = np.array(
+            [_SUIT_IDX[card["suit"]] for card in cards], np.int8
+        )
+
+        counts = np.bincount(self.suits_arr, minlength=4)
+        self.cardValues = self.ranks_arr * counts[self.suits_arr]
+        self.handValue = int(self.cardValues.sum())
+
+        valuePerSuit = np.bincount(
+            self.suits_arr, weights=self.cardValues, minlength=4
+        )
+        self.suitCounts = {
+            suit: int(counts[i] * valuePerSuit[i])
+            for i, suit in enumerate("hsdc")
+        }
+
+    def getSuitCounts(self):
+        return self.suitCounts
+
+    def bid(self):
+        i = bisect.bisect_right(_BID_THRESHOLDS, self.handValue)
+
+        return "p" if i == 0 else 6 + i
+
 
 def main():
     playerNames = ["Player 1", "Player 2", "Player 3", "Player 4"]
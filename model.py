@@ -4,13 +4,78 @@ Copyright: Hashem A. Damrah, 2024
 Description: This file contains the Tarneeb game model.
 """
 
-import os
-import random
+import bisect
+import operator
 import time
 
 import numpy as np
 from gymnasium import Env
 from gymnasium.spaces import Box, Discrete
+from numba import njit
+
+SUITS = ("h", "d", "c", "s")
+RANKS = ("2", "3", "4", "5", "6", "7", "8", "9", "10",
+         "J", "Q", "K", "A")
+
+_SUIT_IDX = {"h": 0, "s": 1, "d": 2, "c": 3}
+_RANK_IDX = {rank: i + 1 for i, rank in enumerate(RANKS)}
+
+# Structure-of-Arrays view of the deck: every card has an id in 0..51
+# (cid = suit_idx * 13 + rank_idx) and these arrays map a cid back to its
+# suit index and rank value without touching the Card object.
+SUIT_OF = np.repeat(np.arange(4, dtype=np.uint8), 13)
+RANK_OF = np.tile(np.arange(1, 14, dtype=np.uint8), 4)
+
+# One bit per card id; SUIT_MASK[s] selects the 13 cards of suit s, so
+# "any card of suit s in hand" is a single AND against the hand mask.
+SUIT_MASK = tuple(((1 << 13) - 1) << (s * 13) for s in range(4))
+
+# C-level key extraction for hand sorts: the key is computed once per
+# card instead of once per comparison.
+_SORT_KEY = operator.attrgetter("sort_key")
+
+# Display strings interned once per card id instead of an f-string
+# allocation per Card.
+_DISPLAY = tuple(f"{RANKS[i % 13]}{'HSDC'[i // 13]}" for i in range(52))
+
+_RNG = np.random.default_rng()
+
+
+@njit(cache=True)
+def trick_winner(trump, first, cids, ranks_tbl, suits_tbl):
+    """
+    Finds the winning card of a trick. A card is worth double its rank
+    in the trump suit, its rank in the led suit, and 0 otherwise.
+
+    Args:
+        trump (int): The suit index of the trump suit.
+        first (int): The suit index of the first card played.
+        cids (ndarray): The card ids played, in play order.
+        ranks_tbl (ndarray): The RANK_OF lookup table.
+        suits_tbl (ndarray): The SUIT_OF lookup table.
+
+    Returns:
+        int: The index of the winning card in cids.
+    """
+
+    best = -1
+    idx = 0
+    for i in range(cids.shape[0]):
+        suit = suits_tbl[cids[i]]
+        rank = ranks_tbl[cids[i]]
+
+        if suit == trump:
+            value = 2 * rank
+        elif suit == first:
+            value = rank
+        else:
+            value = 0
+
+        if value > best:
+            best = value
+            idx = i
+
+    return idx
 
 
 class Card:
@@ -20,9 +85,17 @@ class Card:
     Attributes:
         suit: The suit of the card (h, d, c, s).
         rank: The rank of the card (2, 3, 4, 5, 6, 7, 8, 9, 10, J, Q, K, A).
+        suit_idx: The index of the suit in sort order (h, s, d, c).
+        rank_value: The value of the rank (2 -> 1, ..., A -> 13).
+        cid: The card id (0..51) indexing the SUIT_OF/RANK_OF arrays.
+        sort_key: Single-int hand-sort key (suit ascending, rank
+            descending).
         display: The display of the card (rank + suit).
     """
 
+    __slots__ = ("suit", "rank", "suit_idx", "rank_value", "cid",
+                 "sort_key", "display")
+
     def __init__(self, suit, rank):
         """
         The constructor for the Card class.
@@ -35,7 +108,11 @@ class Card:
 
         self.suit = suit
         self.rank = rank
-        self.display = f"{rank}{suit.upper()}"
+        self.suit_idx = _SUIT_IDX[suit]
+        self.rank_value = _RANK_IDX[rank]
+        self.cid = self.suit_idx * 13 + self.rank_value - 1
+        self.sort_key = self.suit_idx * 100 - self.rank_value
+        self.display = _DISPLAY[self.cid]
 
     def __repr__(self):
         """
@@ -48,6 +125,16 @@ class Card:
         return self.display
 
 
+# Cards are immutable, so every deck shares this single pool instead of
+# rebuilding 52 Card objects per hand. Built in _SUIT_IDX suit order so
+# the pool is cid-indexed: _FULL_DECK[card.cid] is card.
+_FULL_DECK = tuple(
+    Card(suit, rank)
+    for suit in sorted(SUITS, key=_SUIT_IDX.__getitem__)
+    for rank in RANKS
+)
+
+
 class Deck:
     """
     This class represents a deck of cards.
@@ -59,16 +146,14 @@ class Deck:
     def __init__(self):
         """ The constructor for the Deck class. """
 
-        suits = ["h", "d", "c", "s"]
-        ranks = ["2", "3", "4", "5", "6", "7", "8", "9", "10",
-                 "J", "Q", "K", "A"]
-
-        self.cards = [Card(suit, rank) for suit in suits for rank in ranks]
+        self.cards = list(_FULL_DECK)
+        self._pos = 0
 
     def shuffle(self):
         """ Shuffles the deck of cards. """
 
-        random.shuffle(self.cards)
+        self.cards = [_FULL_DECK[cid] for cid in _RNG.permutation(52)]
+        self._pos = 0
 
     def deal(self, numCards):
         """
@@ -81,8 +166,8 @@ class Deck:
             list: The dealt cards.
         """
 
-        dealtCards = self.cards[:numCards]
-        self.cards = self.cards[numCards:]
+        dealtCards = self.cards[self._pos:self._pos + numCards]
+        self._pos += numCards
 
         return dealtCards
 
@@ -93,36 +178,69 @@ class Player:
 
     Attributes:
         name: The name of the player.
+        team: The index of the player's team (0 or 1).
         hand: The cards in the player's hand.
         bid: The bid of the player.
     """
 
-    def __init__(self, name):
+    __slots__ = ("name", "team", "hand", "bid", "hand_mask",
+                 "_hand_str_cache")
+
+    def __init__(self, name, team=0):
         """
         The constructor for the Player class.
 
         Args:
             name (str): The name of the player.
+            team (int): The index of the player's team (0 or 1).
         """
 
         self.name = name
+        self.team = team
+        self.reset()
+
+    def reset(self):
+        """ Resets the player's hand and bid for a new game. """
+
         self.hand = []
         self.bid = None
+        self.hand_mask = 0
+        self._hand_str_cache = None
 
     def clearHand(self):
         """ Clears the player's hand. """
 
         self.hand = []
+        self.hand_mask = 0
+        self._hand_str_cache = None
 
     def addCard(self, card):
         """
-        Adds a card to the player's hand.
+        Adds a card to the player's hand, keeping the hand in suit and
+        rank order.
 
         Args:
             card (Card): The card to add to the player's hand.
         """
 
-        self.hand.append(card)
+        bisect.insort(self.hand, card, key=_SORT_KEY)
+        self.hand_mask |= 1 << card.cid
+        self._hand_str_cache = None
+
+    def setHand(self, cards):
+        """
+        Replaces the player's hand with the given cards, sorted, and
+        rebuilds the hand bitmask.
+
+        Args:
+            cards (list): The cards to give the player.
+        """
+
+        self.hand = list(cards)
+        self.organizeHand()
+        self.hand_mask = 0
+        for card in self.hand:
+            self.hand_mask |= 1 << card.cid
 
     def playCard(self, cardIndex):
         """
@@ -135,7 +253,24 @@ class Player:
             Card: The card played from the player's hand.
         """
 
-        return self.hand.pop(cardIndex)
+        card = self.hand.pop(cardIndex)
+        self.hand_mask &= ~(1 << card.cid)
+        self._hand_str_cache = None
+
+        return card
+
+    def hasSuit(self, suit):
+        """
+        Checks whether the player holds any card of the given suit.
+
+        Args:
+            suit (str): The suit to check (h, s, d, c).
+
+        Returns:
+            bool: Whether the player has a card of the suit.
+        """
+
+        return bool(self.hand_mask & SUIT_MASK[_SUIT_IDX[suit]])
 
     def showHand(self):
         """
@@ -147,66 +282,25 @@ class Player:
 
         return [str(card) for card in self.hand]
 
-    def organizeHand(self):
-        """ Organizes the player's hand by suit and rank. """
-
-        suitOrder = {"h": 0, "s": 1, "d": 2, "c": 3}
-        self.hand = sorted(
-            self.hand,
-            key=lambda card: (
-                suitOrder[card.suit],
-                -self._cardSortKey(card),
-            ),
-        )
-
-    def _cardSortKey(self, card):
+    def showHandStr(self):
         """
-        Sorts the cards in the player's hand by rank.
-
-        Args:
-            card (Card): The card to sort.
+        Shows the player's hand as a display string, cached until the
+        hand changes.
 
         Returns:
-            int: The rank of the card.
-        """
-
-        rankOrder = {
-            "2": 1,
-            "3": 2,
-            "4": 3,
-            "5": 4,
-            "6": 5,
-            "7": 6,
-            "8": 7,
-            "9": 8,
-            "10": 9,
-            "J": 10,
-            "Q": 11,
-            "K": 12,
-            "A": 13,
-        }
-
-        return rankOrder[card.rank]
-
-    def _suitSortKey(self, suit):
+            str: The cards in the player's hand, comma separated.
         """
-        Sorts the cards in the player's hand by suit.
 
-        Args:
-            suit (str): The suit of the card.
+        if self._hand_str_cache is None:
+            self._hand_str_cache = ", ".join(self.showHand())
 
-        Returns:
-            int: The suit of the card.
-        """
+        return self._hand_str_cache
 
-        suitOrder = {
-            "Hearts": 0,
-            "Spades": 1,
-            "Diamonds": 2,
-            "Clubs": 3,
-        }
+    def organizeHand(self):
+        """ Organizes the player's hand by suit and rank. """
 
-        return suitOrder[suit]
+        self.hand.sort(key=_SORT_KEY)
+        self._hand_str_cache = None
 
     def setBid(self, bid):
         """
@@ -231,30 +325,45 @@ class TarneebGame(Env):
         action_space: The action space of the game. (Relate to GYM)
         observation_space: The observation space of the game. (Relate to GYM)
         playerNames: The names of the players in the game.
+        headless: Whether terminal output such as screen clears is
+            skipped (used for RL training).
+        ui_delay: Seconds to pause after each trick; 0 (the default)
+            never sleeps.
         scores: The scores of the players in the game.
         curScores: The scores of the current round.
         isOver: Whether the game is over.
         trump: The trump suit of the game.
         players: The players in the game.
         prevWinner: The previous winner of the game.
-        playedCards: The cards played in the trick.
-        deck: The deck of cards in the game.
+        playedCards: Card ids played so far in the trick (uint8 array,
+            parallel to playedBy).
+        playedBy: The player who played each card in the trick.
         round: The current round.
         firstPlayedSuit: The suit of the first card played in the trick.
         highestBid: The highest bid of the current round.
     """
 
-    def __init__(self, playerNames):
+    def __init__(self, playerNames, headless=False):
         """
         The constructor for the TarneebGame class.
 
         Args:
             playerNames (list): The names of the players in the game.
+            headless (bool): Whether to skip terminal output such as
+                screen clears (used for RL training).
         """
 
         self.playerNames = playerNames
+        self.headless = headless
+        self.ui_delay = 0
         self.scores = [0, 0]
         self.isOver = False
+        self.players = [
+            Player(name, i % 2) for i, name in enumerate(playerNames)
+        ]
+        self._idx_by_name = {
+            player.name: i for i, player in enumerate(self.players)
+        }
         self.action_space = Discrete(13 + 8)  # 13 cards + 8 bids
         self.observation_space = Box(
             low=np.array([0]),
@@ -283,39 +392,30 @@ class TarneebGame(Env):
 
         pass
 
-    def _resetValues(self):
-        self.deck = Deck()
-        self.deck.shuffle()
+    def _clear(self):
+        """
+        Clears the screen with an ANSI escape (erase + cursor home).
+        A single stdout write, no subprocess; skipped when headless.
+        """
 
+        if not self.headless:
+            print("\033[2J\033[H", end="")
+
+    def _resetValues(self):
         self.round = 0
         self.firstPlayedSuit = None
         self.trump = None
         self.prevWinner = None
 
         self.curScores = [0, 0]
-        self.playedCards = []
+        self.playedCards = np.empty(4, dtype=np.uint8)
+        self.playedBy = [None] * 4
+        self._played_n = 0
+        self._turn_start = 0
 
         self.highestBid = {"bid": None, "player": ""}
-        self.players = [Player(name) for name in self.playerNames]
-
-    def _cardSortKey(self, card):
-        """
-        Sorts the cards in the player's hand by rank.
-
-        Args:
-            card (Card): The card to sort.
-
-        Returns:
-            int: The rank of the card.
-        """
-
-        rankOrder = {
-            "2": 1, "3": 2, "4": 3, "5": 4, "6": 5,
-            "7": 6, "8": 7, "9": 8, "10": 9,
-            "J": 10, "Q": 11, "K": 12, "A": 13,
-        }
-
-        return rankOrder[card.rank]
+        for player in self.players:
+            player.reset()
 
     def _getCardValue(self, card):
         """
@@ -337,7 +437,7 @@ class TarneebGame(Env):
 
         suit = card.suit
 
-        value = self._cardSortKey(card)
+        value = card.rank_value
 
         if suit == self.trump:
             return 2 * value
@@ -353,25 +453,21 @@ class TarneebGame(Env):
             player.clearHand()
 
     def dealDeck(self):
-        """ Deals the deck of cards to the players. """
+        """ Deals a shuffled deck of cards to the players. """
 
         self.cleanHands()
-        for _ in range(13):
-            for player in self.players:
-                if not self.deck.cards:
-                    self.deck = Deck()
-                    self.deck.shuffle()
-
-                player.addCard(self.deck.deal(1)[0])
 
-        for player in self.players:
-            player.organizeHand()
+        perm = _RNG.permutation(52)
+        for i, player in enumerate(self.players):
+            player.setHand(
+                [_FULL_DECK[cid] for cid in perm[i * 13:(i + 1) * 13]]
+            )
 
     def displayHands(self):
         """ Displays the players' hands. """
 
         for player in self.players:
-            print(f"{player.name}'s hand: {', '.join(player.showHand())}\n")
+            print(f"{player.name}'s hand: {player.showHandStr()}\n")
 
     def getBid(self, player):
         """
@@ -402,7 +498,13 @@ class TarneebGame(Env):
                 print("Invalid input. Please enter a valid number.")
 
     def getBids(self):
-        """ Gets the bids of the players. """
+        """
+        Gets the bids of the players.
+
+        Returns:
+            bool: True once a bid and trump suit have been chosen, False
+                if everyone passed and the hand must be re-dealt.
+        """
 
         for player in self.players:
             while True:
@@ -428,11 +530,10 @@ class TarneebGame(Env):
                 print(f"{player.name} bids {bid}")
 
         if not self.highestBid["bid"]:
-            os.system("clear")
+            self._clear()
             print("No one bid; restarting round.\n")
 
-            self.dealDeck()
-            self.playRound()
+            return False
 
         print(f"\n{self.highestBid['player']} won the bid.\n")
         self.trump = input("Enter trump suit (h, s, d, c): ")
@@ -446,6 +547,8 @@ class TarneebGame(Env):
             self.trump = input("Enter trump suit (h, s, d, c): ")
             print()
 
+        return True
+
     def playRound(self):
         """ Plays a round of the game. """
 
@@ -453,24 +556,21 @@ class TarneebGame(Env):
         self.displayHands()
 
         if self.round == 1:
-            self.getBids()
-
-            startIndex = self.players.index(
-                next(
-                    player
-                    for player in self.players
-                    if player.name == self.highestBid["player"]
-                )
-            )
+            # Re-deal iteratively until someone bids; recursing back into
+            # playRound here would grow the stack on repeated pass-outs.
+            while not self.getBids():
+                self.dealDeck()
+                self.displayHands()
+
+            startIndex = self._idx_by_name[self.highestBid["player"]]
         else:
             startIndex = 0
             if self.prevWinner:
-                winner = self.prevWinner
-                startIndex = self.players.index(winner)
+                startIndex = self._idx_by_name[self.prevWinner.name]
 
-        self.players = self.players[startIndex:] + self.players[:startIndex]
+        self._turn_start = startIndex
 
-        os.system("clear")
+        self._clear()
 
         curScoresSplit = ' - '.join(map(str, self.curScores))
         totalScoresSplit = ' - '.join(map(str, self.scores))
@@ -501,7 +601,6 @@ class TarneebGame(Env):
         """
 
         cardIndex = None
-        allSuitsInPlayersHand = set([card.suit for card in player.hand])
 
         while True:
             string = (
@@ -518,7 +617,7 @@ class TarneebGame(Env):
                     self.firstPlayedSuit = card.suit
                     break
 
-                if self.firstPlayedSuit in allSuitsInPlayersHand:
+                if player.hasSuit(self.firstPlayedSuit):
                     if card.suit == self.firstPlayedSuit:
                         break
                     else:
@@ -536,24 +635,22 @@ class TarneebGame(Env):
     def getCards(self):
         """ Gets the cards from the players. """
 
-        for i, player in enumerate(self.players):
+        for i in range(len(self.players)):
+            player = self.players[(self._turn_start + i) & 3]
             name = player.name
-            print(f"{name}'s hand: {', '.join(player.showHand())}")
+            print(f"{name}'s hand: {player.showHandStr()}")
 
             cardIndex, card = self.getCardsFromPlayer(i, player)
 
             player.playCard(cardIndex)
-            self.playedCards.append({
-                "card": card,
-                "player": player,
-            })
+            self.playedCards[self._played_n] = card.cid
+            self.playedBy[self._played_n] = player
+            self._played_n += 1
             print(f"{player.name} played {card}")
             print()
 
         self.prevWinner = self.determineWinner()
 
-        self.playedCards = []
-
     def determineWinner(self):
         """
         Determines the winner of the trick.
@@ -562,26 +659,24 @@ class TarneebGame(Env):
             Player: The winner of the trick.
         """
 
-        cardValues = [
-            int(self._getCardValue(card["card"])) for card in self.playedCards
-        ]
-
-        winningCard = max(cardValues)
-        winningCardIndex = cardValues.index(winningCard)
-        winningCardDisplay = self.playedCards[winningCardIndex]["card"]
-        winningPlayer = self.playedCards[winningCardIndex]["player"]
+        winningCardIndex = int(trick_winner(
+            _SUIT_IDX[self.trump],
+            _SUIT_IDX[self.firstPlayedSuit],
+            self.playedCards[:self._played_n],
+            RANK_OF,
+            SUIT_OF,
+        ))
+        winningCardDisplay = _FULL_DECK[self.playedCards[winningCardIndex]]
+        winningPlayer = self.playedBy[winningCardIndex]
 
         print(
             f"{winningPlayer.name} wins",
             f"the round with {winningCardDisplay}!"
         )
 
-        if winningPlayer.name in ["Player 1", "Player 3"]:
-            self.curScores[0] += 1
-        else:
-            self.curScores[1] += 1
+        self.curScores[winningPlayer.team] += 1
 
-        self.playedCards = []
+        self._played_n = 0
 
         return winningPlayer
 
@@ -620,14 +715,13 @@ class TarneebGame(Env):
                 self.round += 1
                 self.playRound()
 
-                time.sleep(2)
-                os.system("clear")
+                if self.ui_delay:
+                    time.sleep(self.ui_delay)
+                self._clear()
 
-            n = 0
-            N = 1
-            if self.highestBid["player"] not in ["Player 1", "Player 3"]:
-                n = 1
-                N = 0
+            bidder = self.players[self._idx_by_name[self.highestBid["player"]]]
+            n = bidder.team
+            N = 1 - n
 
             if self.curScores[n] >= self.highestBid["bid"]:
                 self.scores[n] += self.curScores[n]